@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
-import subprocess
+import hashlib
+import socket
+import ssl
 import time
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 
@@ -12,26 +14,92 @@ from datetime import datetime
 # Or specify interval:
 # python ssl_check.py 30 (checks every 30 seconds)
 
-def check_ssl_certificate(hostname="login.emory.edu", port=443):
+# Certificates are verified against the system CA bundle, unlike the old
+# `openssl s_client` pipeline, which printed whatever the server sent.
+# An expired, self-signed or otherwise untrusted certificate is reported only
+# as an "Error: [SSL: CERTIFICATE_VERIFY_FAILED] ..." line, without its subject
+# or dates. To monitor certificates from a private CA, point SSL_CERT_FILE at a
+# bundle that includes it.
+
+# Separator line, built once instead of on every check
+SEP80 = "-" * 80
+
+# Timestamp format for check and status lines
+TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Short names used by openssl when printing certificate subject/issuer fields
+NAME_ABBREVIATIONS = {
+    "countryName": "C",
+    "stateOrProvinceName": "ST",
+    "localityName": "L",
+    "organizationName": "O",
+    "organizationalUnitName": "OU",
+    "commonName": "CN",
+}
+
+def format_name(name):
     """
-    Check SSL certificate information for a given hostname and port.
+    Format a subject/issuer tuple from getpeercert() the way openssl prints it.
+    """
+    return ", ".join(f"{NAME_ABBREVIATIONS.get(key, key)} = {value}" for rdn in name for key, value in rdn)
+
+def parse_certificate(cert):
+    """
+    Parse a certificate dict from getpeercert() into subject/issuer/notBefore/notAfter/subjectAltName.
+    Dates become UTC datetimes so expiry checks are a plain comparison.
+    """
+    return {
+        "subject": format_name(cert.get('subject', ())),
+        "issuer": format_name(cert.get('issuer', ())),
+        "notBefore": datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notBefore']), timezone.utc),
+        "notAfter": datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notAfter']), timezone.utc),
+        "subjectAltName": [f"{kind}:{value}" for kind, value in cert.get('subjectAltName', ())],
+    }
+
+def format_cert_time(when):
     """
-    cmd = [
-        "bash", "-c",
-        f"echo | openssl s_client -connect {hostname}:{port} -servername {hostname} 2>/dev/null | "
-        f"openssl x509 -noout -subject -issuer -dates -ext subjectAltName"
+    Format a certificate date the way openssl prints it, e.g. 'Jan  5 12:00:00 2026 GMT'.
+    """
+    return f"{when:%b} {when.day:2d} {when:%H:%M:%S %Y} GMT"
+
+def format_certificate(info):
+    """
+    Format parsed certificate details like `openssl x509 -subject -issuer -dates -ext subjectAltName`.
+    """
+    lines = [
+        f"subject={info['subject']}",
+        f"issuer={info['issuer']}",
+        f"notBefore={format_cert_time(info['notBefore'])}",
+        f"notAfter={format_cert_time(info['notAfter'])}",
     ]
+    if info['subjectAltName']:
+        lines.append("X509v3 Subject Alternative Name: ")
+        lines.append("    " + ", ".join(info['subjectAltName']))
+    return "\n".join(lines)
+
+def check_ssl_certificate(hostname="login.emory.edu", port=443, ctx=None, last_fp=None):
+    """
+    Check SSL certificate information for a given hostname and port.
+    Pass a shared SSLContext as ctx to avoid reloading the CA bundle on every check.
+    Returns (fingerprint, text); when the SHA-256 fingerprint matches last_fp the
+    certificate is not re-formatted and text is a one-line 'unchanged' marker.
+    """
+    if ctx is None:
+        ctx = ssl.create_default_context()
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return result.stdout.strip()
-        else:
-            return f"Error: {result.stderr.strip()}"
-    except subprocess.TimeoutExpired:
-        return "Error: Command timed out"
+        with socket.create_connection((hostname, port), timeout=30) as sock:
+            with ctx.wrap_socket(sock, server_hostname=hostname) as ssl_sock:
+                der = ssl_sock.getpeercert(binary_form=True)
+                fingerprint = hashlib.sha256(der).digest()
+                if fingerprint == last_fp:
+                    return fingerprint, f"Certificate unchanged (fp={fingerprint.hex()[:16]})"
+                cert = ssl_sock.getpeercert()
+        return fingerprint, format_certificate(parse_certificate(cert))
+    except socket.timeout:
+        return None, "Error: Connection timed out"
     except Exception as e:
-        return f"Error: {str(e)}"
+        return None, f"Error: {str(e)}"
 
 def main():
     hostname = "login.emory.edu"
@@ -51,16 +119,28 @@ def main():
     print(f"Check interval: {interval} seconds")
     print("Press Ctrl+C to stop\n")
 
+    # Load the trust store once and reuse it for every check
+    ctx = ssl.create_default_context()
+
     try:
+        next_tick = time.monotonic()
+        last_fp = None
         while True:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime(TS_FMT)
             print(f"[{timestamp}] Checking SSL certificate...")
 
-            result = check_ssl_certificate(hostname, port)
+            last_fp, result = check_ssl_certificate(hostname, port, ctx, last_fp)
             print(result)
-            print("-" * 80)
+            print(SEP80)
 
-            time.sleep(interval)
+            # Sleep until the next scheduled tick so check time doesn't stretch the period
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (slow check or system stall); restart the schedule from now
+                next_tick = time.monotonic()
 
     except KeyboardInterrupt:
         print("\nStopping SSL certificate monitoring...")
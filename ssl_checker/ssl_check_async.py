@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+import asyncio
+import hashlib
+import ssl
+import time
+import sys
+import os
+import argparse
+from datetime import datetime, timezone
+
+######################################################
+#CLI Arguments:
+
+#-t, --target: server[:port],website pair to monitor (repeat for each target)
+#-i, --interval: Check interval in seconds (optional, default 60)
+
+# All targets are checked concurrently, so one process can watch many servers.
+# The website is used as the TLS server name (SNI and hostname check), so backend
+# nodes serving the website's certificate verify against the website.
+# Certificates are verified against the system CA bundle: an expired, self-signed
+# or otherwise untrusted certificate is reported only as an
+# "Error: [SSL: CERTIFICATE_VERIFY_FAILED] ..." line, without its subject or dates.
+# To monitor certificates from a private CA, point SSL_CERT_FILE at a bundle that includes it.
+
+#Usage Examples:
+# Both login servers behind login.emory.edu
+    #python ssl_check_async.py -t intidpappprd101.cc.emory.edu,login.emory.edu -t intidpappprd102.cc.emory.edu,login.emory.edu -i 5
+
+# Mixed sites and ports
+    #python ssl_check_async.py -t github.com,github.com -t example.com:8443,example.com -i 120
+
+# Long form arguments
+    #python ssl_check_async.py --target login.emory.edu,login.emory.edu --interval 60
+
+# Help
+    #python ssl_check_async.py -h
+#######################################################
+
+# Upper bound on handshakes in flight, to avoid running out of file descriptors
+MAX_CONCURRENT_CHECKS = 64
+
+# Separator lines, built once instead of on every check
+SEP80 = "-" * 80
+EQ80 = "=" * 80
+
+# Timestamp format for check and status lines
+TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Short names used by openssl when printing certificate subject/issuer fields
+NAME_ABBREVIATIONS = {
+    "countryName": "C",
+    "stateOrProvinceName": "ST",
+    "localityName": "L",
+    "organizationName": "O",
+    "organizationalUnitName": "OU",
+    "commonName": "CN",
+}
+
+def format_name(name):
+    """
+    Format a subject/issuer tuple from getpeercert() the way openssl prints it.
+    """
+    return ", ".join(f"{NAME_ABBREVIATIONS.get(key, key)} = {value}" for rdn in name for key, value in rdn)
+
+def parse_certificate(cert):
+    """
+    Parse a certificate dict from getpeercert() into subject/issuer/notBefore/notAfter/subjectAltName.
+    Dates become UTC datetimes so expiry checks are a plain comparison.
+    """
+    return {
+        "subject": format_name(cert.get('subject', ())),
+        "issuer": format_name(cert.get('issuer', ())),
+        "notBefore": datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notBefore']), timezone.utc),
+        "notAfter": datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notAfter']), timezone.utc),
+        "subjectAltName": [f"{kind}:{value}" for kind, value in cert.get('subjectAltName', ())],
+    }
+
+def format_cert_time(when):
+    """
+    Format a certificate date the way openssl prints it, e.g. 'Jan  5 12:00:00 2026 GMT'.
+    """
+    return f"{when:%b} {when.day:2d} {when:%H:%M:%S %Y} GMT"
+
+def format_certificate(info):
+    """
+    Format parsed certificate details like `openssl x509 -subject -issuer -dates -ext subjectAltName`.
+    """
+    lines = [
+        f"subject={info['subject']}",
+        f"issuer={info['issuer']}",
+        f"notBefore={format_cert_time(info['notBefore'])}",
+        f"notAfter={format_cert_time(info['notAfter'])}",
+    ]
+    if info['subjectAltName']:
+        lines.append("X509v3 Subject Alternative Name: ")
+        lines.append("    " + ", ".join(info['subjectAltName']))
+    return "\n".join(lines)
+
+async def check_ssl_async(hostname, port, ctx, semaphore, last_fp=None, server_name=None):
+    """
+    Check SSL certificate information for a given hostname and port without blocking the event loop.
+    server_name is the name sent as SNI and verified against the certificate (default: hostname).
+    Returns (fingerprint, text); when the SHA-256 fingerprint matches last_fp the
+    certificate is not re-formatted and text is a one-line 'unchanged' marker.
+    """
+    async with semaphore:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(hostname, port, ssl=ctx, server_hostname=server_name or hostname),
+                timeout=30,
+            )
+        except asyncio.TimeoutError:
+            return None, "Error: Connection timed out"
+        except Exception as e:
+            return None, f"Error: {str(e)}"
+
+        try:
+            ssl_object = writer.get_extra_info('ssl_object')
+            fingerprint = hashlib.sha256(ssl_object.getpeercert(binary_form=True)).digest()
+            if fingerprint == last_fp:
+                return fingerprint, f"Certificate unchanged (fp={fingerprint.hex()[:16]})"
+            return fingerprint, format_certificate(parse_certificate(ssl_object.getpeercert()))
+        except Exception as e:
+            return None, f"Error: {str(e)}"
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+async def check_all(targets, ctx, last_fps):
+    """
+    Check every (hostname, port, website) target concurrently, returning (fingerprint, text) in target order.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+    return await asyncio.gather(*(
+        check_ssl_async(hostname, port, ctx, semaphore, last_fp, website)
+        for (hostname, port, website), last_fp in zip(targets, last_fps)
+    ))
+
+def write_to_file(log_fd, content):
+    """
+    Append content to the open log file with error handling.
+    os.write may write fewer bytes than asked, so keep writing until the whole block is out.
+    """
+    data = memoryview(content.encode('utf-8'))
+    try:
+        while data:
+            data = data[os.write(log_fd, data):]
+    except OSError as e:
+        print(f"Error writing to file: {e}")
+
+def parse_hostname_port(hostname_arg):
+    """
+    Parse hostname:port format, default port to 443 if not specified.
+    """
+    if ':' in hostname_arg:
+        hostname, port_str = hostname_arg.rsplit(':', 1)
+        try:
+            port = int(port_str)
+            return hostname, port
+        except ValueError:
+            print(f"Error: Invalid port number '{port_str}'")
+            sys.exit(1)
+    else:
+        return hostname_arg, 443
+
+def parse_target(target_arg):
+    """
+    Parse a server[:port],website pair into (hostname, port, website).
+    """
+    if ',' not in target_arg:
+        print(f"Error: Invalid target '{target_arg}', expected server[:port],website")
+        sys.exit(1)
+    server, website = target_arg.split(',', 1)
+    hostname, port = parse_hostname_port(server)
+    return hostname, port, website
+
+def main():
+    # Set up argument parser
+    parser = argparse.ArgumentParser(
+        description='Monitor SSL certificates for several web servers concurrently',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s -t login.emory.edu,login.emory.edu
+  %(prog)s -t github.com,github.com -t example.com:8443,example.com -i 120
+  %(prog)s --target login.emory.edu,login.emory.edu --interval 60
+        '''
+    )
+
+    parser.add_argument('-t', '--target',
+                       action='append',
+                       required=True,
+                       help='server[:port],website pair to monitor (repeat for each target)')
+
+    parser.add_argument('-i', '--interval',
+                       type=int,
+                       default=60,
+                       help='Check interval in seconds (default: 60)')
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Validate interval
+    if args.interval <= 0:
+        print("Error: Interval must be a positive number")
+        sys.exit(1)
+
+    targets = [parse_target(target) for target in args.target]
+    interval = args.interval
+
+    # Generate log filename with timestamp
+    start_time = time.strftime("%Y%m%d_%H%M%S")
+    log_filename = f"ssl_check_multi_{start_time}.log"
+
+    # Create header message
+    header = f"SSL Certificate Monitoring Started"
+    target_lines = "\n".join(f"  {website} ({hostname}:{port})" for hostname, port, website in targets)
+    header_details = f"Targets:\n{target_lines}\nInterval: {interval} seconds\nLog file: {log_filename}\nStarted: {time.strftime(TS_FMT)}"
+
+    # Keep the log file open for the whole run and append each block with one os.write
+    try:
+        log_fd = os.open(log_filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    except OSError as e:
+        print(f"Error opening log file: {e}")
+        sys.exit(1)
+
+    # Display and log startup info
+    startup_msg = f"{EQ80}\n{header}\n{EQ80}\n{header_details}\n{EQ80}"
+    print(startup_msg)
+    write_to_file(log_fd, startup_msg + '\n')
+
+    print("Press Ctrl+C to stop\n")
+
+    # Load the trust store once and reuse it for every check
+    ctx = ssl.create_default_context()
+
+    try:
+        next_tick = time.monotonic()
+        last_fps = [None] * len(targets)
+        check_count = 0
+        while True:
+            check_count += 1
+            timestamp = time.strftime(TS_FMT)
+
+            # Create check header
+            check_header = f"[Check #{check_count}] [{timestamp}] Checking SSL certificates for {len(targets)} targets..."
+
+            # Run all SSL checks concurrently
+            outcomes = asyncio.run(check_all(targets, ctx, last_fps))
+            last_fps = [fingerprint for fingerprint, _ in outcomes]
+
+            # Display and log the whole check with one write each
+            parts = [check_header]
+            for (hostname, port, website), (_, result) in zip(targets, outcomes):
+                parts.append(f"{website} ({hostname}:{port}):\n{result}\n{SEP80}")
+            block = "\n".join(parts) + "\n"
+            sys.stdout.write(block)
+            write_to_file(log_fd, block)
+
+            # Sleep until the next scheduled tick so check time doesn't stretch the period
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (slow check or system stall); restart the schedule from now
+                next_tick = time.monotonic()
+
+    except KeyboardInterrupt:
+        # Final message
+        end_time = time.strftime(TS_FMT)
+        final_msg = f"\n[{end_time}] SSL certificate monitoring for {len(targets)} targets stopped after {check_count} checks."
+
+        final_block = f"{final_msg}\nResults saved to: {log_filename}\n{EQ80}\n"
+        sys.stdout.write(final_block)
+        write_to_file(log_fd, final_block)
+
+        sys.exit(0)
+
+    finally:
+        os.close(log_fd)
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
-import subprocess
+import hashlib
+import socket
+import ssl
 import time
 import sys
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 #Usage Examples:
@@ -21,35 +23,104 @@ from datetime import datetime
 
 
 
-def check_ssl_certificate(hostname, port=443):
+# Certificates are verified against the system CA bundle, unlike the old
+# `openssl s_client` pipeline, which printed whatever the server sent.
+# An expired, self-signed or otherwise untrusted certificate is reported only
+# as an "Error: [SSL: CERTIFICATE_VERIFY_FAILED] ..." line, without its subject
+# or dates. To monitor certificates from a private CA, point SSL_CERT_FILE at a
+# bundle that includes it.
+
+# Separator lines, built once instead of on every check
+SEP80 = "-" * 80
+EQ80 = "=" * 80
+
+# Timestamp format for check and status lines
+TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Short names used by openssl when printing certificate subject/issuer fields
+NAME_ABBREVIATIONS = {
+    "countryName": "C",
+    "stateOrProvinceName": "ST",
+    "localityName": "L",
+    "organizationName": "O",
+    "organizationalUnitName": "OU",
+    "commonName": "CN",
+}
+
+def format_name(name):
     """
-    Check SSL certificate information for a given hostname and port.
+    Format a subject/issuer tuple from getpeercert() the way openssl prints it.
+    """
+    return ", ".join(f"{NAME_ABBREVIATIONS.get(key, key)} = {value}" for rdn in name for key, value in rdn)
+
+def parse_certificate(cert):
     """
-    cmd = [
-        "bash", "-c",
-        f"echo | openssl s_client -connect {hostname}:{port} -servername {hostname} 2>/dev/null | "
-        f"openssl x509 -noout -subject -issuer -dates -ext subjectAltName"
+    Parse a certificate dict from getpeercert() into subject/issuer/notBefore/notAfter/subjectAltName.
+    Dates become UTC datetimes so expiry checks are a plain comparison.
+    """
+    return {
+        "subject": format_name(cert.get('subject', ())),
+        "issuer": format_name(cert.get('issuer', ())),
+        "notBefore": datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notBefore']), timezone.utc),
+        "notAfter": datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notAfter']), timezone.utc),
+        "subjectAltName": [f"{kind}:{value}" for kind, value in cert.get('subjectAltName', ())],
+    }
+
+def format_cert_time(when):
+    """
+    Format a certificate date the way openssl prints it, e.g. 'Jan  5 12:00:00 2026 GMT'.
+    """
+    return f"{when:%b} {when.day:2d} {when:%H:%M:%S %Y} GMT"
+
+def format_certificate(info):
+    """
+    Format parsed certificate details like `openssl x509 -subject -issuer -dates -ext subjectAltName`.
+    """
+    lines = [
+        f"subject={info['subject']}",
+        f"issuer={info['issuer']}",
+        f"notBefore={format_cert_time(info['notBefore'])}",
+        f"notAfter={format_cert_time(info['notAfter'])}",
     ]
+    if info['subjectAltName']:
+        lines.append("X509v3 Subject Alternative Name: ")
+        lines.append("    " + ", ".join(info['subjectAltName']))
+    return "\n".join(lines)
+
+def check_ssl_certificate(hostname, port=443, ctx=None, last_fp=None):
+    """
+    Check SSL certificate information for a given hostname and port.
+    Pass a shared SSLContext as ctx to avoid reloading the CA bundle on every check.
+    Returns (fingerprint, text); when the SHA-256 fingerprint matches last_fp the
+    certificate is not re-formatted and text is a one-line 'unchanged' marker.
+    """
+    if ctx is None:
+        ctx = ssl.create_default_context()
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return result.stdout.strip()
-        else:
-            return f"Error: {result.stderr.strip()}"
-    except subprocess.TimeoutExpired:
-        return "Error: Command timed out"
+        with socket.create_connection((hostname, port), timeout=30) as sock:
+            with ctx.wrap_socket(sock, server_hostname=hostname) as ssl_sock:
+                der = ssl_sock.getpeercert(binary_form=True)
+                fingerprint = hashlib.sha256(der).digest()
+                if fingerprint == last_fp:
+                    return fingerprint, f"Certificate unchanged (fp={fingerprint.hex()[:16]})"
+                cert = ssl_sock.getpeercert()
+        return fingerprint, format_certificate(parse_certificate(cert))
+    except socket.timeout:
+        return None, "Error: Connection timed out"
     except Exception as e:
-        return f"Error: {str(e)}"
+        return None, f"Error: {str(e)}"
 
-def write_to_file(filename, content):
+def write_to_file(log_fd, content):
     """
-    Write content to file with error handling.
+    Append content to the open log file with error handling.
+    os.write may write fewer bytes than asked, so keep writing until the whole block is out.
     """
+    data = memoryview(content.encode('utf-8'))
     try:
-        with open(filename, 'a', encoding='utf-8') as f:
-            f.write(content + '\n')
-    except Exception as e:
+        while data:
+            data = data[os.write(log_fd, data):]
+    except OSError as e:
         print(f"Error writing to file: {e}")
 
 def parse_hostname_port(hostname_arg):
@@ -94,63 +165,73 @@ def main():
             sys.exit(1)
 
     # Generate log filename with timestamp
-    start_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+    start_time = time.strftime("%Y%m%d_%H%M%S")
     # Clean hostname for filename (replace special chars)
     clean_hostname = hostname.replace(':', '_').replace('/', '_')
     log_filename = f"ssl_check_{clean_hostname}_{port}_{start_time}.log"
 
     # Create header message
     header = f"SSL Certificate Monitoring Started"
-    header_details = f"Target: {hostname}:{port}\nInterval: {interval} seconds\nLog file: {log_filename}\nStarted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    separator = "=" * 80
+    header_details = f"Target: {hostname}:{port}\nInterval: {interval} seconds\nLog file: {log_filename}\nStarted: {time.strftime(TS_FMT)}"
+
+    # Keep the log file open for the whole run and append each block with one os.write
+    try:
+        log_fd = os.open(log_filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    except OSError as e:
+        print(f"Error opening log file: {e}")
+        sys.exit(1)
 
     # Display and log startup info
-    startup_msg = f"{separator}\n{header}\n{separator}\n{header_details}\n{separator}"
+    startup_msg = f"{EQ80}\n{header}\n{EQ80}\n{header_details}\n{EQ80}"
     print(startup_msg)
-    write_to_file(log_filename, startup_msg)
+    write_to_file(log_fd, startup_msg + '\n')
 
     print("Press Ctrl+C to stop\n")
 
+    # Load the trust store once and reuse it for every check
+    ctx = ssl.create_default_context()
+
     try:
+        next_tick = time.monotonic()
+        last_fp = None
         check_count = 0
         while True:
             check_count += 1
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime(TS_FMT)
 
             # Create check header
             check_header = f"[Check #{check_count}] [{timestamp}] Checking SSL certificate for {hostname}:{port}..."
-            print(check_header)
-            write_to_file(log_filename, check_header)
 
             # Run SSL check
-            result = check_ssl_certificate(hostname, port)
-
-            # Display and log results
-            print(result)
-            write_to_file(log_filename, result)
-
-            # Add separator
-            separator_line = "-" * 80
-            print(separator_line)
-            write_to_file(log_filename, separator_line)
-
-            time.sleep(interval)
+            last_fp, result = check_ssl_certificate(hostname, port, ctx, last_fp)
+
+            # Display and log the whole check with one write each
+            block = f"{check_header}\n{result}\n{SEP80}\n"
+            sys.stdout.write(block)
+            write_to_file(log_fd, block)
+
+            # Sleep until the next scheduled tick so check time doesn't stretch the period
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (slow check or system stall); restart the schedule from now
+                next_tick = time.monotonic()
 
     except KeyboardInterrupt:
         # Final message
-        end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        end_time = time.strftime(TS_FMT)
         final_msg = f"\n[{end_time}] SSL certificate monitoring stopped after {check_count} checks."
-        final_separator = "=" * 80
-
-        print(final_msg)
-        print(f"Results saved to: {log_filename}")
-        print(final_separator)
 
-        write_to_file(log_filename, final_msg)
-        write_to_file(log_filename, f"Results saved to: {log_filename}")
-        write_to_file(log_filename, final_separator)
+        final_block = f"{final_msg}\nResults saved to: {log_filename}\n{EQ80}\n"
+        sys.stdout.write(final_block)
+        write_to_file(log_fd, final_block)
 
         sys.exit(0)
 
+    finally:
+        os.close(log_fd)
+
 if __name__ == "__main__":
     main()
@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
-import subprocess
+import hashlib
+import socket
+import ssl
 import time
 import sys
 import os
-import argparse
-from datetime import datetime
+import getopt
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 
 ############################################################################
 ############################################################################
 #CLI Arguments:
-# -w, --website: Website hostname (required)
+# -w, --website: Website hostname, or comma-separated hostnames checked in parallel (required)
 # -p, --port: Port number (optional, default: 443)
 # -i, --interval: Check interval in seconds (optional, default: 60)
 
@@ -22,6 +25,8 @@ from datetime import datetime
     # python ssl_checkV3.py -w example.com -p 8443
 # All custom values
     # python ssl_checkV3.py -w google.com -p 443 -i 120
+# Several websites, checked in parallel each interval
+    # python ssl_checkV3.py -w login.emory.edu,github.com,google.com -i 30
 # Long form arguments
     # python ssl_checkV3.py --website login.emory.edu --port 443 --interval 60
 # Help
@@ -31,140 +36,281 @@ from datetime import datetime
 
 
 
-def check_ssl_certificate(hostname, port=443):
+# Certificates are verified against the system CA bundle, unlike the old
+# `openssl s_client` pipeline, which printed whatever the server sent.
+# An expired, self-signed or otherwise untrusted certificate is reported only
+# as an "Error: [SSL: CERTIFICATE_VERIFY_FAILED] ..." line, without its subject
+# or dates. To monitor certificates from a private CA, point SSL_CERT_FILE at a
+# bundle that includes it.
+
+# Help text for -h/--help (hand-written; argparse is slow to import for three options)
+USAGE = """usage: ssl_check_with_website_and_port.py [-h] -w WEBSITE [-p PORT] [-i INTERVAL]
+
+Monitor SSL certificates for websites
+
+options:
+  -h, --help            show this help message and exit
+  -w, --website WEBSITE
+                        Website hostname/domain name (comma-separated to check several in parallel)
+  -p, --port PORT       Port number (default: 443)
+  -i, --interval INTERVAL
+                        Check interval in seconds (default: 60)
+
+Examples:
+  ssl_check_with_website_and_port.py -w login.emory.edu
+  ssl_check_with_website_and_port.py -w github.com -i 30
+  ssl_check_with_website_and_port.py -w example.com -p 8443
+  ssl_check_with_website_and_port.py --website login.emory.edu --port 443 --interval 60
+  ssl_check_with_website_and_port.py -w google.com -p 443 -i 120
+  ssl_check_with_website_and_port.py -w login.emory.edu,github.com,google.com -i 30"""
+
+# Translation table for turning a website name into a safe log filename component
+FILENAME_SANITIZE = str.maketrans({':': '_', '/': '_', '.': '_'})
+
+# Separator lines, built once instead of on every check
+SEP80 = "-" * 80
+EQ80 = "=" * 80
+
+# Socket timeout for each blocking connect/handshake step; Ctrl+C waits for in-flight checks to hit it
+CONNECT_TIMEOUT = 30
+
+# Timestamp format for check and status lines
+TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Short names used by openssl when printing certificate subject/issuer fields
+NAME_ABBREVIATIONS = {
+    "countryName": "C",
+    "stateOrProvinceName": "ST",
+    "localityName": "L",
+    "organizationName": "O",
+    "organizationalUnitName": "OU",
+    "commonName": "CN",
+}
+
+def format_name(name):
     """
-    Check SSL certificate information for a given hostname and port.
+    Format a subject/issuer tuple from getpeercert() the way openssl prints it.
+    """
+    return ", ".join(f"{NAME_ABBREVIATIONS.get(key, key)} = {value}" for rdn in name for key, value in rdn)
+
+def parse_certificate(cert):
+    """
+    Parse a certificate dict from getpeercert() into subject/issuer/notBefore/notAfter/subjectAltName.
+    Dates become UTC datetimes so expiry checks are a plain comparison.
+    """
+    return {
+        "subject": format_name(cert.get('subject', ())),
+        "issuer": format_name(cert.get('issuer', ())),
+        "notBefore": datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notBefore']), timezone.utc),
+        "notAfter": datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notAfter']), timezone.utc),
+        "subjectAltName": [f"{kind}:{value}" for kind, value in cert.get('subjectAltName', ())],
+    }
+
+def format_cert_time(when):
+    """
+    Format a certificate date the way openssl prints it, e.g. 'Jan  5 12:00:00 2026 GMT'.
+    """
+    return f"{when:%b} {when.day:2d} {when:%H:%M:%S %Y} GMT"
+
+def format_certificate(info):
+    """
+    Format parsed certificate details like `openssl x509 -subject -issuer -dates -ext subjectAltName`.
     """
-    cmd = [
-        "bash", "-c",
-        f"echo | openssl s_client -connect {hostname}:{port} -servername {hostname} 2>/dev/null | "
-        f"openssl x509 -noout -subject -issuer -dates -ext subjectAltName"
+    lines = [
+        f"subject={info['subject']}",
+        f"issuer={info['issuer']}",
+        f"notBefore={format_cert_time(info['notBefore'])}",
+        f"notAfter={format_cert_time(info['notAfter'])}",
     ]
+    if info['subjectAltName']:
+        lines.append("X509v3 Subject Alternative Name: ")
+        lines.append("    " + ", ".join(info['subjectAltName']))
+    return "\n".join(lines)
+
+def check_ssl_certificate(hostname, port=443, ctx=None, last_fp=None):
+    """
+    Check SSL certificate information for a given hostname and port.
+    Pass a shared SSLContext as ctx to avoid reloading the CA bundle on every check.
+    Returns (fingerprint, text); when the SHA-256 fingerprint matches last_fp the
+    certificate is not re-formatted and text is a one-line 'unchanged' marker.
+    """
+    if ctx is None:
+        ctx = ssl.create_default_context()
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return result.stdout.strip()
-        else:
-            return f"Error: {result.stderr.strip()}"
-    except subprocess.TimeoutExpired:
-        return "Error: Command timed out"
+        with socket.create_connection((hostname, port), timeout=CONNECT_TIMEOUT) as sock:
+            with ctx.wrap_socket(sock, server_hostname=hostname) as ssl_sock:
+                der = ssl_sock.getpeercert(binary_form=True)
+                fingerprint = hashlib.sha256(der).digest()
+                if fingerprint == last_fp:
+                    return fingerprint, f"Certificate unchanged (fp={fingerprint.hex()[:16]})"
+                cert = ssl_sock.getpeercert()
+        return fingerprint, format_certificate(parse_certificate(cert))
+    except socket.timeout:
+        return None, "Error: Connection timed out"
     except Exception as e:
-        return f"Error: {str(e)}"
+        return None, f"Error: {str(e)}"
 
-def write_to_file(filename, content):
+def write_to_file(log_fd, content):
     """
-    Write content to file with error handling.
+    Append content to the open log file with error handling.
+    os.write may write fewer bytes than asked, so keep writing until the whole block is out.
     """
+    data = memoryview(content.encode('utf-8'))
     try:
-        with open(filename, 'a', encoding='utf-8') as f:
-            f.write(content + '\n')
-    except Exception as e:
+        while data:
+            data = data[os.write(log_fd, data):]
+    except OSError as e:
         print(f"Error writing to file: {e}")
 
 def main():
-    # Set up argument parser
-    parser = argparse.ArgumentParser(
-        description='Monitor SSL certificates for websites',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog='''
-Examples:
-  %(prog)s -w login.emory.edu
-  %(prog)s -w github.com -i 30
-  %(prog)s -w example.com -p 8443
-  %(prog)s --website login.emory.edu --port 443 --interval 60
-  %(prog)s -w google.com -p 443 -i 120
-        '''
-    )
-
-    parser.add_argument('-w', '--website',
-                       required=True,
-                       help='Website hostname/domain name')
-
-    parser.add_argument('-p', '--port',
-                       type=int,
-                       default=443,
-                       help='Port number (default: 443)')
-
-    parser.add_argument('-i', '--interval',
-                       type=int,
-                       default=60,
-                       help='Check interval in seconds (default: 60)')
-
-    # Parse arguments
-    args = parser.parse_args()
+    # Parse command line arguments
+    try:
+        opts, extra_args = getopt.getopt(sys.argv[1:], "hw:p:i:", ["help", "website=", "port=", "interval="])
+    except getopt.GetoptError as e:
+        print(f"Error: {e}")
+        print(USAGE)
+        sys.exit(1)
+
+    if extra_args:
+        print(f"Error: Unexpected argument '{extra_args[0]}'")
+        sys.exit(1)
+
+    website = None
+    port = 443
+    interval = 60
+    for opt, value in opts:
+        if opt in ("-h", "--help"):
+            print(USAGE)
+            sys.exit(0)
+        elif opt in ("-w", "--website"):
+            website = value
+        elif opt in ("-p", "--port"):
+            try:
+                port = int(value)
+            except ValueError:
+                print("Error: Port must be a valid number")
+                sys.exit(1)
+        elif opt in ("-i", "--interval"):
+            try:
+                interval = int(value)
+            except ValueError:
+                print("Error: Interval must be a valid number")
+                sys.exit(1)
 
     # Validate arguments
-    if args.interval <= 0:
+    if website is None:
+        print("Error: -w/--website is required")
+        print(USAGE)
+        sys.exit(1)
+
+    if interval <= 0:
         print("Error: Interval must be a positive number")
         sys.exit(1)
 
-    if args.port <= 0 or args.port > 65535:
+    if port <= 0 or port > 65535:
         print("Error: Port must be between 1 and 65535")
         sys.exit(1)
 
-    website = args.website
-    port = args.port
-    interval = args.interval
+    websites = [name.strip() for name in website.split(',') if name.strip()]
+    if not websites:
+        print("Error: At least one website is required")
+        sys.exit(1)
 
     # Generate log filename with timestamp
-    start_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-    # Clean website name for filename (replace special chars)
-    clean_website = website.replace(':', '_').replace('/', '_').replace('.', '_')
-    log_filename = f"script_output/ssl_check_{clean_website}_{port}_{start_time}.log"
+    start_time = time.strftime("%Y%m%d_%H%M%S")
+    if len(websites) > 1:
+        # A long website list would overflow the filename length limit
+        log_filename = f"script_output/ssl_check_multi_{port}_{start_time}.log"
+    else:
+        # Clean website name for filename (replace special chars)
+        clean_website = websites[0].translate(FILENAME_SANITIZE)
+        log_filename = f"script_output/ssl_check_{clean_website}_{port}_{start_time}.log"
 
     # Create header message
     header = f"SSL Certificate Monitoring Started"
-    header_details = f"Website: {website}\nPort: {port}\nInterval: {interval} seconds\nLog file: {log_filename}\nStarted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    separator = "=" * 80
+    header_details = f"Website: {website}\nPort: {port}\nInterval: {interval} seconds\nLog file: {log_filename}\nStarted: {time.strftime(TS_FMT)}"
+
+    # Keep the log file open for the whole run and append each block with one os.write
+    try:
+        os.makedirs(os.path.dirname(log_filename), exist_ok=True)
+        log_fd = os.open(log_filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    except OSError as e:
+        print(f"Error opening log file: {e}")
+        sys.exit(1)
 
     # Display and log startup info
-    startup_msg = f"{separator}\n{header}\n{separator}\n{header_details}\n{separator}"
+    startup_msg = f"{EQ80}\n{header}\n{EQ80}\n{header_details}\n{EQ80}"
     print(startup_msg)
-    write_to_file(log_filename, startup_msg)
+    write_to_file(log_fd, startup_msg + '\n')
 
     print("Press Ctrl+C to stop\n")
 
+    # Load the trust store once and reuse it for every check
+    ctx = ssl.create_default_context()
+
+    # Handshakes block on the network, so threads overlap them; the pool lives for the whole run
+    executor = ThreadPoolExecutor(max_workers=min(32, len(websites)))
+    multiple = len(websites) > 1
+    target_label = f"{len(websites)} websites on port {port}" if multiple else f"{website}:{port}"
+
     try:
+        next_tick = time.monotonic()
+        last_fps = [None] * len(websites)
         check_count = 0
+        checks_in_flight = False
         while True:
             check_count += 1
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime(TS_FMT)
 
             # Create check header
-            check_header = f"[Check #{check_count}] [{timestamp}] Checking SSL certificate for {website}:{port}..."
-            print(check_header)
-            write_to_file(log_filename, check_header)
+            check_header = f"[Check #{check_count}] [{timestamp}] Checking SSL certificate for {target_label}..."
 
-            # Run SSL check
-            result = check_ssl_certificate(website, port)
+            # Run SSL checks for all websites in parallel
+            checks_in_flight = True
+            outcomes = list(executor.map(lambda name, last_fp: check_ssl_certificate(name, port, ctx, last_fp),
+                                         websites, last_fps))
+            checks_in_flight = False
+            last_fps = [fingerprint for fingerprint, _ in outcomes]
 
-            # Display and log results
-            print(result)
-            write_to_file(log_filename, result)
+            # Display and log the whole check with one write each
+            parts = [check_header]
+            for name, (_, result) in zip(websites, outcomes):
+                if multiple:
+                    parts.append(f"{name}:{port}:")
+                parts.append(result)
+                parts.append(SEP80)
+            block = "\n".join(parts) + "\n"
+            sys.stdout.write(block)
+            write_to_file(log_fd, block)
 
-            # Add separator
-            separator_line = "-" * 80
-            print(separator_line)
-            write_to_file(log_filename, separator_line)
-
-            time.sleep(interval)
+            # Sleep until the next scheduled tick so check time doesn't stretch the period
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (slow check or system stall); restart the schedule from now
+                next_tick = time.monotonic()
 
     except KeyboardInterrupt:
         # Final message
-        end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        final_msg = f"\n[{end_time}] SSL certificate monitoring for {website}:{port} stopped after {check_count} checks."
-        final_separator = "=" * 80
+        end_time = time.strftime(TS_FMT)
+        final_msg = f"\n[{end_time}] SSL certificate monitoring for {target_label} stopped after {check_count} checks."
 
-        print(final_msg)
-        print(f"Results saved to: {log_filename}")
-        print(final_separator)
+        if checks_in_flight:
+            # Pool threads can't be interrupted; Python joins them at exit once their sockets give up
+            print(f"\nWaiting until in-flight checks time out (up to {CONNECT_TIMEOUT} seconds per socket operation)...")
 
-        write_to_file(log_filename, final_msg)
-        write_to_file(log_filename, f"Results saved to: {log_filename}")
-        write_to_file(log_filename, final_separator)
+        final_block = f"{final_msg}\nResults saved to: {log_filename}\n{EQ80}\n"
+        sys.stdout.write(final_block)
+        write_to_file(log_fd, final_block)
 
         sys.exit(0)
 
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        os.close(log_fd)
+
 if __name__ == "__main__":
     main()